@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Profile dashboard pipeline: collect GitHub data, then render the SVG cards."""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from src.collectors import GitHubCollector
+from src.generators import (ActivityCalendarGenerator, CareerTimelineGenerator,
+                            CompactChartGenerator, EnhancedSVGRenderer)
+
+# (generator class, render method, takes_metrics) triples; each runs in
+# its own process. The career timeline renders from data/career.json
+# rather than collected metrics.
+GENERATOR_JOBS = [
+    (ActivityCalendarGenerator, 'generate_activity_calendar', True),
+    (CompactChartGenerator, 'generate_activity_compact', True),
+    (CompactChartGenerator, 'generate_streak_compact', True),
+    (CompactChartGenerator, 'generate_tier_compact', True),
+    (EnhancedSVGRenderer, 'generate_stats_hero', True),
+    (EnhancedSVGRenderer, 'generate_language_chart', True),
+    (EnhancedSVGRenderer, 'generate_activity_timeline', True),
+    (EnhancedSVGRenderer, 'generate_streak_card', True),
+    (CareerTimelineGenerator, 'generate_timeline', False),
+    (CareerTimelineGenerator, 'generate_compact_experience', False),
+]
+
+
+def build_metrics():
+    """Collect everything once and shape it for the generators."""
+    collector = GitHubCollector()
+    data = collector.collect_everything()
+
+    daily = {}
+    for commit in data['commits']:
+        day = commit['date'][:10]
+        daily[day] = daily.get(day, 0) + 1
+
+    commits_per_day = [
+        {'date': day, 'count': count} for day, count in sorted(daily.items())]
+
+    # Streaks over consecutive active days.
+    current = longest = 0
+    previous = None
+    for day in sorted(daily):
+        day_date = date.fromisoformat(day)
+        if previous is not None and (day_date - previous).days == 1:
+            current += 1
+        else:
+            current = 1
+        longest = max(longest, current)
+        previous = day_date
+
+    # A streak is only "current" if it reaches today (or yesterday, so a
+    # run before the day's first commit doesn't zero it out).
+    if previous is None or (date.today() - previous).days > 1:
+        current = 0
+
+    stats = data['stats']
+    stats['total_prs'] = len(data['pull_requests'])
+    stats['total_issues'] = len(data['issues'])
+
+    return {
+        'daily_stats': {
+            'commits_per_day': commits_per_day,
+            'average_commits': (
+                sum(daily.values()) / len(daily) if daily else 0.0),
+        },
+        'activity_streak': {'current': current, 'longest': longest},
+        'languages': data['stats'].get('languages', {}),
+        'repos': data['repos'],
+        'pull_requests': data['pull_requests'],
+        'issues': data['issues'],
+        'stats': stats,
+    }
+
+
+def _run_generator(cls, method, metrics, takes_metrics):
+    generator = cls()
+    bound = getattr(generator, method)
+    return bound(metrics) if takes_metrics else bound()
+
+
+def main():
+    metrics = build_metrics()
+
+    # Rendering is independent, CPU-bound string formatting; one process
+    # per generator sidesteps the GIL.
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(_run_generator, cls, method, metrics, takes_metrics)
+            for cls, method, takes_metrics in GENERATOR_JOBS
+        ]
+        for future in futures:
+            print(f'generated {future.result()}')
+
+
+if __name__ == '__main__':
+    main()
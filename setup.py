@@ -0,0 +1,28 @@
+"""Optional native build for the hot SVG-rendering path.
+
+The pipeline runs fine as pure Python; running
+
+    python setup.py build_ext --inplace
+
+with mypy/mypyc installed compiles the string-heavy renderer module to a
+C extension, which typically lands a 3-10x speedup on batch card
+generation. Without mypyc this is a no-op.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        'src/generators/advanced_svg_renderer.py',
+        'src/generators/compact_components.py',
+        'src/generators/enhanced_svg.py',
+    ])
+except ImportError:
+    ext_modules = []
+
+setup(
+    name='profile-dashboard',
+    version='0.1',
+    ext_modules=ext_modules,
+)
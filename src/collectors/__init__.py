@@ -0,0 +1,3 @@
+from .github_collector import GitHubCollector
+
+__all__ = ['GitHubCollector']
@@ -0,0 +1,9 @@
+from .activity_calendar import ActivityCalendarGenerator
+from .advanced_svg_renderer import AdvancedSVGRenderer
+from .career_timeline import CareerTimelineGenerator
+from .compact_components import CompactChartGenerator
+from .enhanced_svg import EnhancedSVGRenderer
+
+__all__ = ['ActivityCalendarGenerator', 'AdvancedSVGRenderer',
+           'CareerTimelineGenerator', 'CompactChartGenerator',
+           'EnhancedSVGRenderer']
@@ -0,0 +1,415 @@
+"""Reusable SVG building blocks (cards, badges, stat boxes, progress rings)."""
+
+import functools
+import gzip
+import json
+import math
+import re
+import sys
+from array import array
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements
+    _json_loads = json.loads
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import copy
+
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is in requirements
+    etree = None
+
+# CSS gradient grammar: angle plus a stop list whose rgba(...) commas must
+# not split the stops, which the old replace/split parse got wrong.
+_GRAD_RE = re.compile(r'linear-gradient\(\s*(-?\d+)deg\s*,\s*(.+)\)$')
+_STOP_RE = re.compile(r'(rgba?\([^)]*\)|#[0-9a-fA-F]+|\w+)(?:\s+(\d+%))?')
+
+
+# Parsed themes keyed by (path, mtime); instances treat them read-only.
+_THEME_CACHE = {}
+
+
+# Output directories already ensured this process; skips the stat syscall
+# when many renderers share a base path.
+_CREATED_DIRS = set()
+
+
+# Approximate per-character advance widths (px at 10px UI font) so badge
+# and tooltip boxes fit proportional text instead of assuming 7px per char.
+_CHAR_WIDTHS = array('f', [6.0] * 128)
+for _c in "iljI.,:;!|'\"`()[]{} ":
+    _CHAR_WIDTHS[ord(_c)] = 3.2
+for _c in 'ftr-':
+    _CHAR_WIDTHS[ord(_c)] = 4.5
+for _c in 'ABCDEFGHKNOPQRSUVXYZ0123456789':
+    _CHAR_WIDTHS[ord(_c)] = 7.2
+for _c in 'mwMW@':
+    _CHAR_WIDTHS[ord(_c)] = 9.8
+del _c
+
+
+@functools.lru_cache(maxsize=16)
+def _circumference(radius):
+    return 2 * math.pi * radius
+
+
+@functools.lru_cache(maxsize=64)
+def _angle_to_coords(angle):
+    """Convert a CSS gradient angle to SVG x1/y1/x2/y2 percentages."""
+    rad = math.radians(angle - 90)
+    c = 50 * math.cos(rad)
+    s = 50 * math.sin(rad)
+    return 50 - c, 50 - s, 50 + c, 50 + s
+
+
+def _text_width(text):
+    """Sum advance widths for `text`; non-ASCII falls back to 7px."""
+    return sum(_CHAR_WIDTHS[o] if (o := ord(c)) < 128 else 7.0 for c in text)
+
+
+# Pure static XML; no interpolation, so build it exactly once at import.
+_STATIC_FILTERS_SVG = '''
+        <filter id="soft-shadow" x="-20%" y="-20%" width="140%" height="140%">
+            <feDropShadow dx="0" dy="2" stdDeviation="3" flood-opacity="0.3"/>
+        </filter>
+        <filter id="glow" x="-50%" y="-50%" width="200%" height="200%">
+            <feGaussianBlur stdDeviation="4" result="blur"/>
+            <feMerge>
+                <feMergeNode in="blur"/>
+                <feMergeNode in="SourceGraphic"/>
+            </feMerge>
+        </filter>
+        '''
+
+
+class AdvancedSVGRenderer:
+    """Assembles themed SVG components shared by the dashboard cards."""
+
+    def __init__(self, theme_name='dark', base_path=None):
+        self.base_path = Path(base_path) if base_path else Path(__file__).resolve().parents[2]
+        self.theme = self._load_theme(theme_name)
+        self.output_dir = self.base_path / 'output'
+        if self.output_dir not in _CREATED_DIRS:
+            self.output_dir.mkdir(exist_ok=True)
+            _CREATED_DIRS.add(self.output_dir)
+
+    def _load_theme(self, theme_name):
+        theme_path = self.base_path / 'themes' / f'{theme_name}.json'
+        key = (str(theme_path), theme_path.stat().st_mtime)
+        theme = _THEME_CACHE.get(key)
+        if theme is None:
+            with open(theme_path, 'rb') as f:
+                theme = _json_loads(f.read())
+            _THEME_CACHE[key] = theme
+        # Rendered defs/styles depend only on the theme; drop them so the
+        # next access rebuilds from the new one.
+        self._defs_cache = None
+        self._styles_cache = None
+        # One interned id per gradient; _parse_gradients emits through it.
+        self._gradient_ids = {
+            name: sys.intern(f'gradient-{name}') for name in theme.get('gradients', {})
+        }
+        self._defs_body = self._parse_gradients(theme)
+        # Stable identity for cross-instance style memoization.
+        self._theme_key = json.dumps(theme, sort_keys=True)
+        self._card_template = None
+        return theme
+
+    # ------------------------------------------------------------------
+    # Shared <defs> and <style> blocks
+    # ------------------------------------------------------------------
+
+    def _create_defs(self):
+        """Return the `<defs>` block, built once per theme and then cached."""
+        if self._defs_cache is None:
+            self._defs_cache = self._build_defs()
+        return self._defs_cache
+
+    def _create_styles(self):
+        """Return the `<style>` block, built once per theme and then cached."""
+        if self._styles_cache is None:
+            self._styles_cache = self._build_styles()
+        return self._styles_cache
+
+    def _parse_gradients(self, theme):
+        """Resolve every theme gradient to final XML once, at load time."""
+        buf = []
+        for name, gradient in theme.get('gradients', {}).items():
+            match = _GRAD_RE.match(gradient)
+            if not match:
+                continue
+            gradient_id = self._gradient_ids[name]
+            x1, y1, x2, y2 = _angle_to_coords(int(match.group(1)))
+            stops = _STOP_RE.findall(match.group(2))
+
+            buf.append(
+                f'<linearGradient id="{gradient_id}" '
+                f'x1="{x1:.1f}%" y1="{y1:.1f}%" x2="{x2:.1f}%" y2="{y2:.1f}%">'
+            )
+            for i, (color, offset) in enumerate(stops):
+                if not offset:
+                    offset = f'{i * 100 // max(len(stops) - 1, 1)}%'
+                buf.append(f'<stop offset="{offset}" stop-color="{color}"/>')
+            buf.append('</linearGradient>\n')
+        return ''.join(buf)
+
+    def _build_defs(self):
+        return f'<defs>{self._defs_body}{_STATIC_FILTERS_SVG}</defs>'
+
+    def _build_styles(self):
+        return _render_styles(self._theme_key)
+
+    # ------------------------------------------------------------------
+    # Components
+    # ------------------------------------------------------------------
+
+    def create_symbols_sheet(self):
+        """Zero-size SVG carrying only the shared defs and styles.
+
+        Embed it once per page, then render the individual cards with
+        include_defs=False/include_styles=False so each card stops
+        shipping its own ~3KB copy of the CSS and gradients.
+        """
+        return (
+            '<svg width="0" height="0" xmlns="http://www.w3.org/2000/svg">'
+            f'{self._create_defs()}{self._create_styles()}</svg>'
+        )
+
+    def create_card_batch(self, specs):
+        """Render many cards, sharing one symbols sheet.
+
+        `specs` is an iterable of (width, height, children, title) tuples;
+        returns the symbols sheet followed by the per-card documents.
+        """
+        sheet = [self.create_symbols_sheet()]
+        sheet.extend(
+            self.create_card_container(width, height, children, title,
+                                       include_defs=False, include_styles=False)
+            for width, height, children, title in specs
+        )
+        return sheet
+
+    def _card_tree_template(self):
+        """Parse the shared card scaffold into an element tree once per theme."""
+        if self._card_template is None:
+            scaffold = (
+                '<svg xmlns="http://www.w3.org/2000/svg">'
+                f'{self._create_defs()}{self._create_styles()}'
+                f'<rect class="card" rx="{self.theme["radiusLarge"]}" '
+                'filter="url(#soft-shadow)"/></svg>'
+            )
+            self._card_template = etree.fromstring(scaffold.encode('utf-8'))
+        return self._card_template
+
+    @staticmethod
+    def _maybe_compress(svg, compress):
+        if compress == 'none':
+            return svg
+        if compress == 'gz':
+            return gzip.compress(svg.encode('utf-8'), compresslevel=9)
+        if compress == 'br':
+            if brotli is None:
+                raise RuntimeError("brotli is not installed; use compress='gz'")
+            return brotli.compress(svg.encode('utf-8'))
+        raise ValueError(f'unknown compress mode: {compress!r}')
+
+    def create_card_container(self, width, height, children, title=None,
+                              include_defs=True, include_styles=True,
+                              compress='none', encode=False):
+        """Wrap children in a themed card SVG.
+
+        Returns the document string, or compressed bytes (.svgz style)
+        when `compress` is 'gz' or 'br' -- the repeated class names and
+        gradient markup compress to a small fraction of the source.
+        With `encode=True` (and no compression) the document comes back
+        as UTF-8 bytes, ready for a binary write with no caller-side
+        encode step.
+        """
+        if etree is not None and include_defs and include_styles:
+            svg = self._create_card_tree(width, height, children, title)
+            if compress == 'none' and encode:
+                return svg.encode('utf-8')
+            return self._maybe_compress(svg, compress)
+        parts = [
+            f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" '
+            f'xmlns="http://www.w3.org/2000/svg">',
+        ]
+        if include_defs:
+            parts.append(self._create_defs())
+        if include_styles:
+            parts.append(self._create_styles())
+        parts.append(
+            f'<rect class="card" width="{width}" height="{height}" '
+            f'rx="{self.theme["radiusLarge"]}" filter="url(#soft-shadow)"/>'
+        )
+        if title:
+            parts.append(f'<text class="card-title" x="20" y="32">{escape(title)}</text>')
+        parts.extend(children)
+        parts.append('</svg>')
+        svg = ''.join(parts)
+        if compress == 'none' and encode:
+            return svg.encode('utf-8')
+        return self._maybe_compress(svg, compress)
+
+    def _create_card_tree(self, width, height, children, title):
+        """Clone the parsed scaffold and serialize once at the C level."""
+        root = copy.deepcopy(self._card_tree_template())
+        size = {'width': str(width), 'height': str(height),
+                'viewBox': f'0 0 {width} {height}'}
+        for name, value in size.items():
+            root.set(name, value)
+        rect = root.find('{http://www.w3.org/2000/svg}rect')
+        rect.set('width', str(width))
+        rect.set('height', str(height))
+        if title:
+            body = f'<text class="card-title" x="20" y="32">{escape(title)}</text>'
+        else:
+            body = ''
+        fragment = etree.fromstring(
+            f'<g xmlns="http://www.w3.org/2000/svg">{body}{"".join(children)}</g>'.encode('utf-8'))
+        root.extend(fragment)
+        return etree.tostring(root, encoding='unicode')
+
+    def create_badge(self, text, x, y, color=None):
+        """Small rounded pill with a short text label."""
+        fill = color or self.theme['colors']['accent']
+        text = escape(text)
+        width = round(_text_width(text)) + 16
+        return (
+            f'<g class="fade-in" transform="translate({x}, {y})">'
+            f'<rect width="{width}" height="20" rx="10" fill="{fill}" opacity="0.2"/>'
+            f'<text class="badge-text" x="{width / 2}" y="14" text-anchor="middle">{text}</text>'
+            f'</g>'
+        )
+
+    def create_tooltip(self, text, x, y):
+        """Hover tooltip rectangle with centered text."""
+        text = escape(text)
+        width = round(_text_width(text)) + 12
+        colors = self.theme['colors']
+        return (
+            f'<g transform="translate({x}, {y})">'
+            f'<rect width="{width}" height="24" rx="{self.theme["radius"]}" '
+            f'fill="{colors["background"]}" '
+            f'stroke="{colors["border"]}"/>'
+            f'<text class="badge-text" x="{width / 2}" y="16" text-anchor="middle">{text}</text>'
+            f'</g>'
+        )
+
+    def create_stat_box(self, label, value, x, y, link=None):
+        """Label/value pair, optionally wrapped in a link."""
+        box = (
+            f'<g class="fade-in" transform="translate({x}, {y})">'
+            f'<text class="stat-label" x="0" y="0">{escape(str(label))}</text>'
+            f'<text class="stat-value" x="0" y="24">{escape(str(value))}</text>'
+            f'</g>'
+        )
+        if link:
+            return f'<a href={quoteattr(link)}>{box}</a>'
+        return box
+
+    def create_progress_ring(self, percentage, x, y, radius=40):
+        """Circular progress indicator centered at (x, y)."""
+        circumference = _circumference(radius)
+        offset = circumference * (1 - percentage / 100)
+        return (
+            f'<g transform="translate({x}, {y})">'
+            f'<circle class="ring-track" r="{radius}"/>'
+            f'<circle class="ring-value" r="{radius}" '
+            f'stroke-dasharray="{circumference:.1f}" '
+            f'stroke-dashoffset="{offset:.1f}" '
+            f'style="--ring-c: {circumference:.1f}; '
+            f'animation: progress 2s {self.theme["animations"]["easing"]}"/>'
+            f'<text class="stat-value" y="7" text-anchor="middle">{percentage:.0f}%</text>'
+            f'</g>'
+        )
+
+
+_STYLES_TEMPLATE = '''
+        <style>
+            .card {{
+                fill: {card_bg};
+                stroke: {border};
+                stroke-width: 1;
+            }}
+            .card-title {{
+                font: 600 {size_title}px {font};
+                fill: {text};
+            }}
+            .card-subtitle {{
+                font: 400 {size_subtitle}px {font};
+                fill: {text_secondary};
+            }}
+            .stat-label {{
+                font: 400 {size_label}px {font};
+                fill: {text_secondary};
+                text-transform: uppercase;
+                letter-spacing: 0.5px;
+            }}
+            .stat-value {{
+                font: 700 {size_value}px {font};
+                fill: {text};
+            }}
+            .badge-text {{
+                font: 500 {size_label}px {font};
+                fill: {text};
+            }}
+            .title {{ font: 600 {size_title}px {font}; fill: {text}; }}
+            .label {{ font: 400 {size_label}px {font}; fill: {text_secondary}; }}
+            .value {{ font: 700 {size_value}px {font}; fill: {text}; }}
+            .op-30 {{ opacity: 0.3; }}
+            .op-85 {{ opacity: 0.85; }}
+            .accent {{ fill: {accent}; }}
+            .success {{ fill: {success}; }}
+            .warning {{ fill: {warning}; }}
+            .error {{ fill: {error}; }}
+            .ring-track {{
+                fill: none;
+                stroke: {border};
+                stroke-width: 6;
+            }}
+            .ring-value {{
+                fill: none;
+                stroke: {accent};
+                stroke-width: 6;
+                stroke-linecap: round;
+                transform: rotate(-90deg);
+                transform-origin: center;
+            }}
+            @keyframes fadeIn {{
+                from {{ opacity: 0; }}
+                to {{ opacity: 1; }}
+            }}
+            @keyframes progress {{
+                from {{ stroke-dashoffset: var(--ring-c); }}
+            }}
+            .fade-in,
+            .animated {{
+                animation: fadeIn {anim_duration}
+                           {anim_easing} backwards;
+            }}
+        </style>
+        '''
+
+
+@functools.lru_cache(maxsize=8)
+def _render_styles(theme_key):
+    """Render the CSS for a serialized theme; memoized across instances."""
+    theme = json.loads(theme_key)
+    style_vars = {
+        'font': theme['font'],
+        'anim_duration': theme['animations']['duration'],
+        'anim_easing': theme['animations']['easing'],
+    }
+    style_vars.update(theme['colors'])
+    style_vars.update({f'size_{name}': value for name, value in theme['sizes'].items()})
+    return _STYLES_TEMPLATE.format_map(style_vars)
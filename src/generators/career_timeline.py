@@ -0,0 +1,413 @@
+"""Generates the career timeline SVG from data/career.json."""
+
+import functools
+import hashlib
+import json
+from datetime import datetime
+from html import escape
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# path -> (mtime, parsed JSON); shared by the theme and career loaders so
+# repeated constructions (one generator per output card) parse each file once.
+_JSON_CACHE = {}
+
+
+def _cached_json(path):
+    key = str(path)
+    mtime = path.stat().st_mtime
+    hit = _JSON_CACHE.get(key)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    data = _json_loads(path.read_bytes())
+    _JSON_CACHE[key] = (mtime, data)
+    return data
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_ym(date_str):
+    """strptime is slow; the same 'YYYY-MM' strings recur many times per run."""
+    return datetime.strptime(date_str, '%Y-%m').date()
+
+
+_ENTRY_HEIGHT = 110
+_HEADER_HEIGHT = 70
+_WIDTH = 720
+_LINE_X = 48
+
+# Hottest per-entry fragment, formatted once per entry via str.format with
+# pre-stringified integer coordinates.
+_CARD_TEMPLATE = (
+    '<g class="fade-slide" style="animation-delay: {delay}">'
+    '<rect x="{card_x}" y="{y_pos}" width="{card_width}" height="{card_height}" '
+    'rx="8" fill="{bg}" stroke="{border}"/>'
+    '<text class="entry-title" x="{text_x}" y="{title_y}">{icon} {title}</text>'
+    '<text class="entry-company" x="{text_x}" y="{company_y}">{company}</text>'
+    '<text class="entry-date" x="{date_x}" y="{title_y}" text-anchor="end">{date_text}</text>'
+    '<text class="entry-desc" x="{text_x}" y="{desc_y}">{desc}</text>'
+    '</g>\n'
+)
+
+_CERT_TEMPLATE = (
+    '<g class="fade-slide">'
+    '<rect x="{x}" y="{rect_y}" width="220" height="40" rx="8" '
+    'fill="{bg}" stroke="{border}"/>'
+    '<text class="cert-name" x="{text_x}" y="{name_y}">{name}</text>'
+    '<text class="cert-issuer" x="{text_x}" y="{issuer_y}">{issuer} · {date}</text>'
+    '</g>\n'
+)
+
+
+class CareerTimelineGenerator:
+    """Renders work/education entries as a vertical animated timeline."""
+
+    # Output dirs already created by some instance this process; skips a
+    # stat syscall per construction in multi-generator builds.
+    _ENSURED_DIRS = set()
+
+    def __init__(self, theme_name='dark', base_path=None):
+        self.base_path = Path(base_path) if base_path else Path(__file__).resolve().parents[2]
+        self.theme = self._load_theme(theme_name)
+        self.career_data = self._load_career_data()
+        # Frozen so 'present' is stable for the whole run (and cacheable).
+        self._now = datetime.now().date()
+        self._styles_cache = None
+        # tech name -> (escaped text, badge width); the same few names
+        # repeat across entries and across repeated generations.
+        self._badge_cache = {}
+        self.output_dir = self.base_path / 'output'
+        if self.output_dir not in CareerTimelineGenerator._ENSURED_DIRS:
+            self.output_dir.mkdir(exist_ok=True)
+            CareerTimelineGenerator._ENSURED_DIRS.add(self.output_dir)
+
+    def _load_theme(self, theme_name):
+        return _cached_json(self.base_path / 'themes' / f'{theme_name}.json')
+
+    def _load_career_data(self):
+        return _cached_json(self.base_path / 'data' / 'career.json')
+
+    # ------------------------------------------------------------------
+    # Date helpers
+    # ------------------------------------------------------------------
+
+    def _content_hash(self):
+        """Digest of everything the rendered SVG depends on."""
+        payload = json.dumps(
+            [self.theme, self.career_data], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _parse_date(self, date_str):
+        """'YYYY-MM' string to datetime.date ('present' maps to a frozen now).
+
+        Only .year/.month and ordering are used downstream; date is a
+        smaller object than datetime and compares faster.
+        """
+        if date_str.lower() == 'present':
+            return self._now
+        return _parse_ym(date_str)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _format_date(date_str):
+        if date_str.lower() == 'present':
+            return 'Present'
+        return _parse_ym(date_str).strftime('%b %Y')
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _escape_xml(text):
+        return escape(str(text))
+
+    def _calculate_duration(self, start_str, end_str):
+        """Human duration between two 'YYYY-MM' dates, month precision."""
+        start = self._parse_date(start_str)
+        end = self._parse_date(end_str)
+        total_months = (end.year - start.year) * 12 + (end.month - start.month)
+        if total_months < 1:
+            # Pre-escaped: duration strings go into the SVG verbatim.
+            return '&lt; 1m'
+        years, months = divmod(total_months, 12)
+        if years and months:
+            return f'{years}y {months}m'
+        if years:
+            return f'{years}y'
+        return f'{months}m'
+
+    def _months_since_epoch(self, date_str):
+        """'YYYY-MM' (or 'present') as an absolute month count."""
+        d = self._parse_date(date_str)
+        return d.year * 12 + d.month - 1
+
+    def _ym_months(self, date_strs):
+        """Vector of months-since-epoch for 'YYYY-MM'/'present' strings.
+
+        Slicing out year/month digits avoids strptime entirely; with the
+        values in an int array the duration math below is single C ops.
+        """
+        now_mo = self._now.year * 12 + self._now.month - 1
+        return np.fromiter(
+            (now_mo if s.lower() == 'present'
+             else int(s[:4]) * 12 + int(s[5:7]) - 1
+             for s in date_strs),
+            dtype=np.int64, count=len(date_strs))
+
+    def _calculate_total_experience(self):
+        """Total non-overlapping months across work entries, as 'Xy Ym'."""
+        work = [e for e in self.career_data.get('entries', [])
+                if e.get('type') == 'work']
+        if not work:
+            return '0m'
+
+        starts = self._ym_months([e.get('date_start') for e in work])
+        ends = self._ym_months([e.get('date_end', 'present') for e in work])
+        order = np.argsort(starts, kind='stable')
+        starts = starts[order]
+        ends = ends[order]
+
+        if len(starts) < 8:
+            # NumPy setup cost dominates on tiny inputs; sweep in Python.
+            total_months = 0
+            cur_start = int(starts[0])
+            cur_end = int(ends[0])
+            for start, end in zip(starts.tolist()[1:], ends.tolist()[1:]):
+                if start <= cur_end:
+                    if end > cur_end:
+                        cur_end = end
+                else:
+                    total_months += cur_end - cur_start
+                    cur_start, cur_end = start, end
+            total_months += cur_end - cur_start
+        else:
+            # Vectorized interval merge: a period opens a new group when it
+            # starts after the running max of all earlier ends.
+            running_max_end = np.maximum.accumulate(ends)
+            new_group = np.concatenate(
+                ([True], starts[1:] > running_max_end[:-1]))
+            bounds = np.flatnonzero(new_group)
+            group_start = starts[bounds]
+            group_end = np.maximum.reduceat(ends, bounds)
+            total_months = int((group_end - group_start).sum())
+
+        years, months = divmod(total_months, 12)
+        if years and months:
+            return f'{years}y {months}m'
+        if years:
+            return f'{years}y'
+        return f'{months}m'
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def _create_styles(self):
+        if self._styles_cache is not None:
+            return self._styles_cache
+        self._styles_cache = f'''
+        <style>
+            .tl-title {{ font: 600 18px 'Segoe UI', Ubuntu, sans-serif; fill: {self.theme['colors']['text']}; }}
+            .tl-subtitle {{ font: 400 12px 'Segoe UI', Ubuntu, sans-serif; fill: {self.theme['colors']['text_secondary']}; }}
+            .entry-title {{ font: 600 14px 'Segoe UI', Ubuntu, sans-serif; fill: {self.theme['colors']['text']}; }}
+            .entry-company {{ font: 500 12px 'Segoe UI', Ubuntu, sans-serif; fill: {self.theme['colors']['accent']}; }}
+            .entry-date {{ font: 400 11px 'Segoe UI', Ubuntu, sans-serif; fill: {self.theme['colors']['text_secondary']}; }}
+            .entry-desc {{ font: 400 11px 'Segoe UI', Ubuntu, sans-serif; fill: {self.theme['colors']['text_secondary']}; }}
+            .tech-badge {{ font: 500 9px 'Segoe UI', Ubuntu, sans-serif; fill: {self.theme['colors']['text']}; }}
+            .cert-name {{ font: 500 11px 'Segoe UI', Ubuntu, sans-serif; fill: {self.theme['colors']['text']}; }}
+            .cert-issuer {{ font: 400 10px 'Segoe UI', Ubuntu, sans-serif; fill: {self.theme['colors']['text_secondary']}; }}
+            @keyframes fadeSlide {{
+                from {{ opacity: 0; transform: translateX(-8px); }}
+                to {{ opacity: 1; transform: translateX(0); }}
+            }}
+            .fade-slide {{ animation: fadeSlide 0.5s ease-out backwards; }}
+            @keyframes pulse {{
+                0%, 100% {{ opacity: 1; }}
+                50% {{ opacity: 0.5; }}
+            }}
+            .pulse {{ animation: pulse 2s ease-in-out infinite; }}
+        </style>
+        '''
+        return self._styles_cache
+
+    def generate_timeline(self, output_name='career-timeline.svg'):
+        """Render the full timeline SVG; returns the output path as str."""
+        output_path = self.output_dir / output_name
+        hash_path = self.output_dir / f'.{output_name}.hash'
+        content_hash = self._content_hash()
+        # CI regenerates every card on each run; when theme and career data
+        # are unchanged the previous output is still valid.
+        if output_path.exists() and hash_path.exists():
+            if hash_path.read_text() == content_hash:
+                return str(output_path)
+
+        entries = [e for e in self.career_data.get('entries', []) if e.get('show', True)]
+        sorted_entries = sorted(
+            entries, key=lambda e: self._parse_date(e.get('date_start')), reverse=True)
+        certifications = self.career_data.get('certifications', [])
+
+        # Pull the per-entry fields into parallel lists once, so the render
+        # loop below never re-hits the dicts (several keys are read twice).
+        types = []
+        titles = []
+        companies = []
+        descs = []
+        techs_list = []
+        is_current_list = []
+        date_texts = []
+        for entry in sorted_entries:
+            start = entry.get('date_start')
+            end = entry.get('date_end', 'present')
+            types.append(entry.get('type'))
+            titles.append(entry.get('title', ''))
+            companies.append(entry.get('company', ''))
+            descs.append(entry.get('description', ''))
+            techs_list.append(entry.get('technologies', []))
+            is_current_list.append(end.lower() == 'present')
+            date_text = f'{self._format_date(start)} — {self._format_date(end)}'
+            if entry.get('show_duration'):
+                date_text = f'{date_text} · {self._calculate_duration(start, end)}'
+            date_texts.append(date_text)
+
+        cert_height = 70 if certifications else 0
+        height = (_HEADER_HEIGHT + len(sorted_entries) * _ENTRY_HEIGHT
+                  + cert_height + 20)
+
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as out:
+            self._write_timeline(
+                out, height, types, titles, companies, descs, techs_list,
+                is_current_list, date_texts, certifications)
+        hash_path.write_text(content_hash)
+        return str(output_path)
+
+    def _write_timeline(self, out, height, types, titles, companies, descs,
+                        techs_list, is_current_list, date_texts, certifications):
+        """Stream the timeline SVG to `out` without one big joined string."""
+        width = _WIDTH
+        entry_height = _ENTRY_HEIGHT
+        header_height = _HEADER_HEIGHT
+        line_x = _LINE_X
+        write = out.write
+        # Hoist the theme lookups out of the loop; each is two dict hits.
+        colors = self.theme['colors']
+        card_color = colors['card']
+        border_color = colors['border']
+        background_color = colors['background']
+        accent_color = colors['accent']
+        # (is_current, is_work) -> (dot class, dot radius, dot color, icon);
+        # one precomputed lookup replaces the per-entry if/elif chains.
+        dot_styles = {
+            (True, True): ('pulse', 8, colors['warning'], '💼'),
+            (True, False): ('pulse', 8, colors['warning'], '🎓'),
+            (False, True): ('', 6, colors['success'], '💼'),
+            (False, False): ('', 6, colors['purple'], '🎓'),
+        }
+
+        write(f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" '
+              f'xmlns="http://www.w3.org/2000/svg">\n')
+        write(self._create_styles())
+        write(f'<rect width="{width}" height="{height}" rx="12" '
+              f'fill="{card_color}" stroke="{border_color}" stroke-width="1"/>\n')
+        write('<text class="tl-title" x="24" y="34">Career Timeline</text>\n')
+        write(f'<text class="tl-subtitle" x="24" y="54">'
+              f'Total experience: {self._calculate_total_experience()}</text>\n')
+        write(f'<line x1="{line_x}" y1="{header_height}" x2="{line_x}" '
+              f'y2="{header_height + len(types) * entry_height - 30}" '
+              f'stroke="{border_color}" stroke-width="2"/>\n')
+
+        # One format per entry instead of three inside the loop.
+        delays = [f'{i * 0.15:.2f}s' for i in range(len(types))]
+
+        for global_index, entry_type in enumerate(types):
+            is_current = is_current_list[global_index]
+            # Integer coordinates: int formatting is cheaper than the general
+            # float repr, and SVG doesn't need sub-pixel precision here.
+            y_pos = header_height + global_index * entry_height + 20
+            card_x = line_x + 28
+            card_width = width - card_x - 24
+
+            dot_class, dot_radius, dot_color, type_icon = dot_styles[
+                (is_current, entry_type == 'work')]
+
+            write(f'<circle class="{dot_class}" cx="{line_x}" cy="{y_pos + 10}" '
+                  f'r="{dot_radius}" fill="{dot_color}" '
+                  f'style="animation-delay: {delays[global_index]}"/>\n')
+
+            write(_CARD_TEMPLATE.format(
+                delay=delays[global_index],
+                card_x=card_x,
+                y_pos=y_pos,
+                card_width=card_width,
+                card_height=entry_height - 20,
+                bg=background_color,
+                border=border_color,
+                text_x=card_x + 14,
+                title_y=y_pos + 22,
+                company_y=y_pos + 40,
+                desc_y=y_pos + 58,
+                date_x=card_width + card_x - 14,
+                icon=type_icon,
+                title=self._escape_xml(titles[global_index]),
+                company=self._escape_xml(companies[global_index]),
+                # Date/duration text comes from _format_date and
+                # _calculate_duration, whose outputs are already XML-safe;
+                # escaping again would mangle the '&lt; 1m' case.
+                date_text=date_texts[global_index],
+                desc=self._escape_xml(descs[global_index]),
+            ))
+
+            tech_x = card_x + 14
+            badge_cache = self._badge_cache
+            for tech in techs_list[global_index][:6]:
+                badge = badge_cache.get(tech)
+                if badge is None:
+                    badge = (self._escape_xml(tech), len(tech) * 6 + 12)
+                    badge_cache[tech] = badge
+                tech_label, tech_width = badge
+                write(f'<g class="fade-slide" style="animation-delay: {delays[global_index]}">'
+                      f'<rect x="{tech_x}" y="{y_pos + 68}" width="{tech_width}" height="16" rx="8" '
+                      f'fill="{accent_color}" opacity="0.15"/>'
+                      f'<text class="tech-badge" x="{tech_x + tech_width // 2}" y="{y_pos + 79}" '
+                      f'text-anchor="middle">{tech_label}</text>'
+                      f'</g>\n')
+                tech_x += tech_width + 6
+
+        if certifications:
+            cert_y = header_height + len(types) * entry_height + 10
+            write(f'<text class="tl-subtitle" x="24" y="{cert_y}">Certifications</text>\n')
+            write(''.join(
+                _CERT_TEMPLATE.format(
+                    x=24 + i * 230,
+                    rect_y=cert_y + 8,
+                    bg=background_color,
+                    border=border_color,
+                    text_x=36 + i * 230,
+                    name_y=cert_y + 24,
+                    issuer_y=cert_y + 40,
+                    name=self._escape_xml(cert.get('name', '')),
+                    issuer=self._escape_xml(cert.get('issuer', '')),
+                    date=self._format_date(cert.get('date', 'present')),
+                )
+                for i, cert in enumerate(certifications[:5])
+            ))
+
+        write('</svg>')
+
+    def generate_compact_experience(self, output_name='experience-compact.svg'):
+        """Render a small total-experience card; returns the output path as str."""
+        total = self._calculate_total_experience()
+        width, height = 240, 90
+        svg = f'''<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">
+{self._create_styles()}
+<rect width="{width}" height="{height}" rx="12" fill="{self.theme['colors']['card']}" stroke="{self.theme['colors']['border']}" stroke-width="1"/>
+<text class="tl-subtitle" x="20" y="32">EXPERIENCE</text>
+<text class="tl-title" x="20" y="62">{total}</text>
+</svg>'''
+        output_path = self.output_dir / output_name
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(svg)
+        return str(output_path)
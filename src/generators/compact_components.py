@@ -0,0 +1,309 @@
+"""Small profile cards: activity bars, streak, tier and per-repo cards.
+
+These are the compact companions to the full-size dashboards; each card
+is a thin layout layer on top of AdvancedSVGRenderer's card container.
+"""
+
+import asyncio
+import functools
+import os
+from bisect import bisect_right
+
+import aiofiles
+import numpy as np
+
+from string import Template
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from .advanced_svg_renderer import AdvancedSVGRenderer
+
+@functools.lru_cache(maxsize=4)
+def _worker_generator(theme_name, base_path):
+    """One generator per worker process, built on first task."""
+    return CompactChartGenerator(theme_name=theme_name, base_path=base_path)
+
+
+def _render_repo_card(job):
+    theme_name, base_path, repo, output_name = job
+    return _worker_generator(theme_name, base_path).generate_repo_card(repo, output_name)
+
+
+# Tier thresholds and their display data, parallel and sorted ascending;
+# bisect picks the tier in O(log n) with the whole table on one line.
+_TIER_THRESHOLDS = (0, 50, 150, 300, 500)
+_TIER_DATA = (
+    ('Beginner', '\U0001f331', 'success', 1),
+    ('Intermediate', '\U0001f31f', 'warning', 2),
+    ('Advanced', '\U0001f680', 'accent', 3),
+    ('Expert', '\U0001f525', 'error', 4),
+    ('Elite', '\U0001f451', 'purple', 5),
+)
+
+# The bar rect is the only fragment emitted in a loop; formatting a
+# pre-built template avoids re-parsing an f-string literal per bar.
+_BAR_TMPL = (
+    '<rect class="bar animated op-85" x="{x}" y="{y}" width="{w}" height="{h}" '
+    'rx="2" fill="url(#gradient-accent)" '
+    'style="animation-delay: {d}s"><title>{c} commits on {date}</title></rect>'
+)
+
+
+class CompactChartGenerator:
+    """Renders the compact dashboard cards into the output directory."""
+
+    # Static fragments parsed once at import; substitute() avoids the
+    # per-call f-string evaluation for every card in a refresh.
+    _TITLE_TMPL = Template(
+        '<g class="animated"><text class="title" x="$pad" y="$ty" '
+        'font-size="$size">$icon $label</text></g>')
+    _SUBLABEL_TMPL = Template(
+        '<g class="animated" style="animation-delay: 0.1s">'
+        '<text class="label" x="$pad" y="$ty">$text</text></g>')
+    _STREAK_ROW_TMPL = Template(
+        '<g class="animated" style="animation-delay: 0.1s">'
+        '<text class="value" x="$pad" y="$ty">$value</text>'
+        '<text class="label" x="$rx" y="$ty" text-anchor="end">$right</text></g>')
+    _PROGRESS_TMPL = Template(
+        '<g class="animated" style="animation-delay: 0.2s">'
+        '<rect class="op-30" x="$pad" y="$y" width="$w" height="8" rx="4" '
+        'fill="$track"/>'
+        '<rect x="$pad" y="$y" width="$fill_w" height="8" rx="4" fill="$fill"/></g>')
+
+    def __init__(self, theme_name='dark', base_path=None):
+        self.theme_name = theme_name
+        self.base_path = Path(base_path) if base_path else Path(__file__).resolve().parents[2]
+        self.renderer = AdvancedSVGRenderer(theme_name=theme_name, base_path=self.base_path)
+        self.theme = self.renderer.theme
+        # Theme values the cards read on every render; resolved once so the
+        # hot paths do attribute loads instead of nested dict indexing.
+        colors = self.theme['colors']
+        self._border_color = colors['border']
+        self._accent_color = colors['accent']
+        self._lang_colors = self.theme.get('languageColors') or {}
+        self._tier_fills = {
+            key: colors.get(key, colors['accent'])
+            for (_, _, key, _) in _TIER_DATA
+        }
+        self.output_dir = self.base_path / 'output'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # os.path.join on a cached str beats PurePath.__truediv__ per card.
+        self._out_str = str(self.output_dir)
+
+    def _write_card(self, output_name, svg_bytes):
+        """Write pre-encoded bytes through a raw fd; returns the path str."""
+        output_path = os.path.join(self._out_str, output_name)
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, svg_bytes)
+        finally:
+            os.close(fd)
+        return output_path
+
+    # ------------------------------------------------------------------
+    # Cards
+    # ------------------------------------------------------------------
+
+    def generate_activity_compact(self, metrics, output_name='activity-compact.svg'):
+        """Bar chart of the last 20 days of commits; returns the path as str."""
+        return self._write_card(*self._build_activity(metrics, output_name))
+
+    def _build_activity(self, metrics, output_name='activity-compact.svg'):
+        # One traversal of the nested dict; repeated .get(..., {}) chains
+        # allocate a throwaway default and hash twice per read.
+        ds = metrics.get('daily_stats') or {}
+        daily_stats = ds.get('commits_per_day', ())
+        avg_commits = ds.get('average_commits', 0)
+
+        # One fused pass: total over all days, scale max over the rendered
+        # window, and the (count, date) pairs the bar loop needs.
+        total_commits = 0
+        max_count = 1
+        pairs = []
+        window_start = len(daily_stats) - 20
+        for idx, day in enumerate(daily_stats):
+            count = day.get('count', 0)
+            total_commits += count
+            if idx >= window_start:
+                if count > max_count:
+                    max_count = count
+                pairs.append((count, day.get('date', '')))
+
+        width, height = 320, 140
+        padding = 16
+        chart_x = padding
+        chart_y = 64
+        bar_width = 10
+        bar_spacing = 2
+        max_height = 56
+
+        # Bar geometry as four ufunc passes; .tolist() hands the format
+        # loop plain Python ints/floats, which is cheap at 20 elements.
+        counts = np.fromiter((c for c, _ in pairs), dtype=np.int32, count=len(pairs))
+        heights = counts.astype(np.float32) * (max_height / max_count)
+        xs = chart_x + np.arange(counts.size) * (bar_width + bar_spacing)
+        ys = chart_y + max_height - heights
+        delays = 0.3 + np.arange(counts.size) * 0.02
+
+        # Zero-count days render as height-0 rects; skipping them keeps the
+        # x grid intact while dropping most of the output on sparse months.
+        bars = ''.join(
+            _BAR_TMPL.format(x=x, y=y, w=bar_width, h=h, d=d, c=c, date=date)
+            for x, y, h, d, c, (_, date) in zip(
+                xs.tolist(), ys.tolist(), heights.tolist(), delays.tolist(),
+                counts.tolist(), pairs)
+            if c > 0
+        )
+
+        # One immutable body; create_card_container does the single
+        # ''.join over it, so no intermediate concatenation happens anywhere.
+        children = (
+            self._TITLE_TMPL.substitute(
+                pad=padding, ty=padding + 16, size=16,
+                icon='\U0001f4c8', label='Recent Activity'),
+            self._SUBLABEL_TMPL.substitute(
+                pad=padding, ty=padding + 36,
+                text=f'{total_commits} commits · avg {avg_commits:.1f}/day'),
+            bars,
+        )
+
+        svg_bytes = self.renderer.create_card_container(
+            width, height, children, encode=True, title='Recent activity')
+        return output_name, svg_bytes
+
+    def generate_streak_compact(self, metrics, output_name='streak-compact.svg'):
+        """Current/longest commit streak with a progress bar."""
+        return self._write_card(*self._build_streak(metrics, output_name))
+
+    def _build_streak(self, metrics, output_name='streak-compact.svg'):
+        streak = metrics.get('activity_streak') or {}
+        current_streak = streak.get('current', 0)
+        longest_streak = streak.get('longest', 0)
+
+        width, height = 320, 120
+        padding = 16
+        progress_width = width - 2 * padding
+        fill_width = (min(current_streak, longest_streak or 1)
+                      / max(longest_streak, 1) * progress_width)
+
+        children = (
+            self._TITLE_TMPL.substitute(
+                pad=padding, ty=padding + 16, size=16,
+                icon='\U0001f525', label='Streak'),
+            self._STREAK_ROW_TMPL.substitute(
+                pad=padding, ty=padding + 48, rx=width - padding,
+                value=f'{current_streak} days', right=f'best {longest_streak}'),
+            self._PROGRESS_TMPL.substitute(
+                pad=padding, y=height - 32, w=progress_width,
+                track=self._border_color, fill_w=f'{fill_width:.1f}',
+                fill='url(#gradient-accent)'),
+        )
+
+        svg_bytes = self.renderer.create_card_container(
+            width, height, children, encode=True, title='Commit streak')
+        return output_name, svg_bytes
+
+    def generate_tier_compact(self, metrics, output_name='tier-compact.svg'):
+        """Activity tier badge derived from commit volume and repo count."""
+        return self._write_card(*self._build_tier(metrics, output_name))
+
+    def _build_tier(self, metrics, output_name='tier-compact.svg'):
+        ds = metrics.get('daily_stats') or {}
+        daily_stats = ds.get('commits_per_day', ())
+        total_commits = sum(day.get('count', 0) for day in daily_stats)
+        score = total_commits + len(metrics.get('repos') or ()) * 10
+
+        idx = bisect_right(_TIER_THRESHOLDS, score) - 1
+        tier, tier_icon, tier_color, level = _TIER_DATA[idx]
+
+        width, height = 320, 120
+        padding = 16
+        progress_width = width - 2 * padding
+        fill_width = level * progress_width / 5
+
+        children = (
+            self._TITLE_TMPL.substitute(
+                pad=padding, ty=padding + 16, size=16,
+                icon=tier_icon, label=tier),
+            self._SUBLABEL_TMPL.substitute(
+                pad=padding, ty=padding + 36,
+                text=f'Level {level}/5 · score {score}'),
+            self._PROGRESS_TMPL.substitute(
+                pad=padding, y=height - 32, w=progress_width,
+                track=self._border_color, fill_w=f'{fill_width:.1f}',
+                fill=self._tier_fills[tier_color]),
+        )
+
+        svg_bytes = self.renderer.create_card_container(
+            width, height, children, encode=True, title='Activity tier')
+        return output_name, svg_bytes
+
+    def generate_all_compact(self, metrics):
+        """Render the three metric cards, overlapping the file writes."""
+        return asyncio.run(self.generate_all_compact_async(metrics))
+
+    async def generate_all_compact_async(self, metrics):
+        """Build each card synchronously (pure CPU), then gather the
+        writes so the disk I/O for the three files overlaps."""
+        builds = [
+            self._build_activity(metrics),
+            self._build_streak(metrics),
+            self._build_tier(metrics),
+        ]
+        return list(await asyncio.gather(
+            *(self._write_card_async(name, data) for name, data in builds)))
+
+    async def _write_card_async(self, output_name, svg_bytes):
+        output_path = os.path.join(self._out_str, output_name)
+        async with aiofiles.open(output_path, 'wb') as f:
+            await f.write(svg_bytes)
+        return output_path
+
+    def generate_repo_cards(self, repos):
+        """Render one card per repo across processes; returns output paths.
+
+        Card rendering is independent pure-Python string work, so it
+        parallelizes cleanly; chunksize amortizes pickling of the small
+        per-repo payloads.
+        """
+        jobs = [
+            (self.theme_name, str(self.base_path), repo,
+             f"repo-{repo.get('name', i)}.svg")
+            for i, repo in enumerate(repos)
+        ]
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(_render_repo_card, jobs, chunksize=8))
+
+    def generate_repo_card(self, repo, output_name=None):
+        """Single repository card (name, description, language, stars)."""
+        name = repo.get('name', 'Repository')
+        desc = repo.get('description') or 'No description'
+        description = desc if len(desc) <= 60 else desc[:60] + '...'
+        language = repo.get('language') or 'Unknown'
+        stars = repo.get('stars', 0)
+        forks = repo.get('forks', 0)
+
+        lang_color = self._lang_colors.get(language, self._accent_color)
+
+        width, height = 320, 110
+        padding = 16
+
+        children = (
+            self._TITLE_TMPL.substitute(
+                pad=padding, ty=padding + 16, size=15,
+                icon='\U0001f4e6', label=escape(name)),
+            self._SUBLABEL_TMPL.substitute(
+                pad=padding, ty=padding + 38, text=escape(description)),
+            f'<g class="animated" style="animation-delay: 0.2s">'
+            f'<circle cx="{padding + 5}" cy="{height - 26}" r="5" fill="{lang_color}"/>'
+            f'<text class="label" x="{padding + 16}" y="{height - 22}">{language}</text>'
+            f'<text class="label" x="{width - padding}" y="{height - 22}" '
+            f'text-anchor="end">⭐ {stars} · \U0001f374 {forks}</text></g>',
+        )
+
+        svg_bytes = self.renderer.create_card_container(
+            width, height, children, encode=True, title=f'Repository: {name}')
+        if output_name is None:
+            output_name = f'repo-{name}.svg'
+        return self._write_card(output_name, svg_bytes)